@@ -1,7 +1,8 @@
 """Binomial option pricing (Cox-Ross-Rubinstein) implementation.
 
 The module exposes :func:`price_binomial_option` to price European or American
-calls and puts. Example:
+calls and puts, and :func:`price_binomial_options` to price many options in
+one call. Example:
 
 >>> price_binomial_option(
 ...     spot=100,
@@ -14,12 +15,46 @@ calls and puts. Example:
 ...     exercise="european",
 ... )
 8.026...
+
+The backward induction runs in Numba-compiled kernels when :mod:`numba` is
+installed. Otherwise it uses the Cython extension :mod:`binomial_option_c`
+if it has been built (``cythonize -i binomial_option_c.pyx``), and falls back
+to vectorized NumPy updates of one contiguous ``float64`` array.
 """
 from __future__ import annotations
 
+import functools
 import math
 from typing import Literal
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+try:
+    from numba import config, get_thread_id, njit, prange
+
+    NUMBA_AVAILABLE = True
+    _THREAD_POOL_SIZE = config.NUMBA_NUM_THREADS
+except ImportError:  # pragma: no cover - numba is optional
+    NUMBA_AVAILABLE = False
+    _THREAD_POOL_SIZE = 1
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for :func:`numba.njit` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def get_thread_id() -> int:
+        return 0
+
+
+try:
+    from binomial_option_c import crr_price as _crr_cython
+except ImportError:  # extension not built
+    _crr_cython = None
+
 
 OptionType = Literal["call", "put"]
 ExerciseStyle = Literal["european", "american"]
@@ -36,6 +71,128 @@ def _validate_inputs(spot: float, strike: float, maturity: float, steps: int) ->
         raise ValueError("steps must be at least 1")
 
 
+@njit(cache=True, fastmath=True)
+def _intrinsic(asset_price: float, strike: float, is_call: bool) -> float:
+    if is_call:
+        return max(asset_price - strike, 0.0)
+    return max(strike - asset_price, 0.0)
+
+
+@njit(cache=True, fastmath=True)
+def _terminal_payoffs(
+    payoffs: np.ndarray, spot: float, strike: float, up: float, down: float, steps: int, is_call: bool
+) -> None:
+    # Walk up from the lowest node instead of calling pow twice per node.
+    ratio = up / down
+    asset_price = spot * down**steps
+    for i in range(steps + 1):
+        payoffs[i] = _intrinsic(asset_price, strike, is_call)
+        asset_price *= ratio
+
+
+@njit(cache=True, fastmath=True)
+def _crr_european(
+    payoffs: np.ndarray,
+    spot: float,
+    strike: float,
+    up: float,
+    down: float,
+    discount: float,
+    prob_up: float,
+    steps: int,
+    is_call: bool,
+) -> float:
+    _terminal_payoffs(payoffs, spot, strike, up, down, steps, is_call)
+    prob_down = 1.0 - prob_up
+    for step in range(steps - 1, -1, -1):
+        for i in range(step + 1):
+            payoffs[i] = discount * (prob_up * payoffs[i + 1] + prob_down * payoffs[i])
+    return payoffs[0]
+
+
+@njit(cache=True, fastmath=True)
+def _crr_american(
+    payoffs: np.ndarray,
+    spot: float,
+    strike: float,
+    up: float,
+    down: float,
+    discount: float,
+    prob_up: float,
+    steps: int,
+    is_call: bool,
+) -> float:
+    _terminal_payoffs(payoffs, spot, strike, up, down, steps, is_call)
+    prob_down = 1.0 - prob_up
+    ratio = up / down
+    lowest_price = spot * down**steps
+    for step in range(steps - 1, -1, -1):
+        lowest_price /= down
+        asset_price = lowest_price
+        for i in range(step + 1):
+            continuation = discount * (prob_up * payoffs[i + 1] + prob_down * payoffs[i])
+            payoffs[i] = max(continuation, _intrinsic(asset_price, strike, is_call))
+            asset_price *= ratio
+    return payoffs[0]
+
+
+def _crr_numpy(
+    spot: float,
+    strike: float,
+    up: float,
+    down: float,
+    discount: float,
+    prob_up: float,
+    steps: int,
+    is_call: bool,
+    is_american: bool,
+) -> float:
+    """Backward induction with whole-level NumPy updates, used without Numba."""
+    nodes = np.arange(steps + 1)
+    asset_prices = spot * up**nodes * down ** (steps - nodes)
+    sign = 1.0 if is_call else -1.0
+    payoffs = np.maximum(sign * (asset_prices - strike), 0.0)
+
+    prob_down = 1.0 - prob_up
+    for step in range(steps - 1, -1, -1):
+        # Only the first ``step + 1`` entries are live once we reach this level.
+        continuation = discount * (prob_up * payoffs[1 : step + 2] + prob_down * payoffs[: step + 1])
+        if is_american:
+            level_prices = asset_prices[: step + 1]
+            level_prices /= down
+            np.maximum(continuation, sign * (level_prices - strike), out=continuation)
+        payoffs[: step + 1] = continuation
+
+    return payoffs[0]
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _crr_batch(
+    spots: np.ndarray,
+    strikes: np.ndarray,
+    ups: np.ndarray,
+    downs: np.ndarray,
+    discounts: np.ndarray,
+    probs_up: np.ndarray,
+    steps: np.ndarray,
+    is_call: np.ndarray,
+    is_american: np.ndarray,
+    scratch: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    # ``scratch`` holds one tree buffer per thread, reused across that thread's options.
+    for k in prange(spots.shape[0]):
+        payoffs = scratch[get_thread_id()]
+        if is_american[k]:
+            out[k] = _crr_american(
+                payoffs, spots[k], strikes[k], ups[k], downs[k], discounts[k], probs_up[k], steps[k], is_call[k]
+            )
+        else:
+            out[k] = _crr_european(
+                payoffs, spots[k], strikes[k], ups[k], downs[k], discounts[k], probs_up[k], steps[k], is_call[k]
+            )
+
+
 def price_binomial_option(
     *,
     spot: float,
@@ -93,27 +250,98 @@ def price_binomial_option(
 
     discount = math.exp(-rate * dt)
 
-    # Terminal payoffs
-    payoffs = []
-    for i in range(steps + 1):
-        asset_price = spot * (up ** i) * (down ** (steps - i))
-        intrinsic = max(asset_price - strike, 0.0) if option_type == "call" else max(strike - asset_price, 0.0)
-        payoffs.append(intrinsic)
+    if not NUMBA_AVAILABLE:
+        crr = _crr_numpy if _crr_cython is None else functools.partial(_crr_cython, np.empty(steps + 1))
+        price = crr(spot, strike, up, down, discount, prob_up, steps, option_type == "call", exercise == "american")
+        return float(price)
 
-    # Backward induction through the tree
-    american = exercise == "american"
-    for step in range(steps - 1, -1, -1):
-        for i in range(step + 1):
-            continuation = discount * (prob_up * payoffs[i + 1] + (1 - prob_up) * payoffs[i])
+    payoffs = np.empty(steps + 1)
+    if exercise == "american":
+        price = _crr_american(payoffs, spot, strike, up, down, discount, prob_up, steps, option_type == "call")
+    else:
+        price = _crr_european(payoffs, spot, strike, up, down, discount, prob_up, steps, option_type == "call")
+    return float(price)
 
-            if american:
-                asset_price = spot * (up ** i) * (down ** (step - i))
-                intrinsic = max(asset_price - strike, 0.0) if option_type == "call" else max(strike - asset_price, 0.0)
-                payoffs[i] = max(continuation, intrinsic)
-            else:
-                payoffs[i] = continuation
 
-    return payoffs[0]
+def price_binomial_options(
+    *,
+    spots: ArrayLike,
+    strikes: ArrayLike,
+    rates: ArrayLike,
+    volatilities: ArrayLike,
+    maturities: ArrayLike,
+    steps: ArrayLike,
+    is_call: ArrayLike = True,
+    is_american: ArrayLike = False,
+    dividend_yields: ArrayLike = 0.0,
+) -> np.ndarray:
+    """Price a batch of options with the Cox-Ross-Rubinstein binomial model.
+
+    Each argument is a scalar or a 1-D array with one entry per option;
+    scalars are broadcast to every option. The inputs have the same meaning
+    as in :func:`price_binomial_option`, with ``is_call`` and ``is_american``
+    replacing ``option_type`` and ``exercise``. With :mod:`numba` installed
+    the options are priced in parallel.
+
+    Returns
+    -------
+    numpy.ndarray
+        Present value of each option (empty for an empty batch).
+    """
+    float_inputs = (spots, strikes, rates, volatilities, maturities, dividend_yields)
+    arrays = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in float_inputs),
+        np.atleast_1d(np.asarray(steps, dtype=np.int64)),
+        np.atleast_1d(np.asarray(is_call, dtype=np.bool_)),
+        np.atleast_1d(np.asarray(is_american, dtype=np.bool_)),
+    )
+    if arrays[0].ndim != 1:
+        raise ValueError("option inputs must be scalars or 1-D arrays")
+    spot, strike, rate, volatility, maturity, dividend_yield, step_counts, calls, americans = (
+        np.ascontiguousarray(array) for array in arrays
+    )
+    if spot.shape[0] == 0:
+        return np.empty(0)
+
+    for values, message in (
+        (spot, "spot price must be positive"),
+        (strike, "strike price must be positive"),
+        (maturity, "maturity must be positive"),
+    ):
+        if np.any(values <= 0):
+            raise ValueError(f"{message} (option {int(np.argmax(values <= 0))})")
+    if np.any(step_counts < 1):
+        raise ValueError(f"steps must be at least 1 (option {int(np.argmax(step_counts < 1))})")
+
+    dt = maturity / step_counts
+    up = np.exp(volatility * np.sqrt(dt))
+    down = 1 / up
+    growth = np.exp((rate - dividend_yield) * dt)
+    prob_up = (growth - down) / (up - down)
+
+    invalid = ~((prob_up >= 0) & (prob_up <= 1))
+    if np.any(invalid):
+        raise ValueError(
+            f"risk-neutral probability is outside [0, 1] for option {int(np.argmax(invalid))}; adjust inputs"
+        )
+
+    discount = np.exp(-rate * dt)
+
+    prices = np.empty(spot.shape[0])
+    if not NUMBA_AVAILABLE:
+        if _crr_cython is None:
+            crr = _crr_numpy
+        else:
+            crr = functools.partial(_crr_cython, np.empty(int(step_counts.max()) + 1))
+        for k in range(prices.shape[0]):
+            prices[k] = crr(
+                spot[k], strike[k], up[k], down[k], discount[k], prob_up[k], step_counts[k], calls[k], americans[k]
+            )
+        return prices
+
+    scratch = np.empty((_THREAD_POOL_SIZE, int(step_counts.max()) + 1))
+    _crr_batch(spot, strike, up, down, discount, prob_up, step_counts, calls, americans, scratch, prices)
+    return prices
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled Cox-Ross-Rubinstein backward induction.
+
+:mod:`binomial_option` uses :func:`crr_price` when :mod:`numba` is not
+installed but this extension has been built::
+
+    cythonize -i binomial_option_c.pyx
+
+It mirrors the Numba kernels in :mod:`binomial_option` and works in place on
+a caller-supplied ``float64`` buffer.
+"""
+from libc.math cimport fmax, pow
+
+
+cdef inline double _intrinsic(double asset_price, double strike, bint is_call) noexcept nogil:
+    if is_call:
+        return fmax(asset_price - strike, 0.0)
+    return fmax(strike - asset_price, 0.0)
+
+
+cdef void _terminal_payoffs(
+    double[::1] payoffs, double spot, double strike, double up, double down, int steps, bint is_call
+) noexcept nogil:
+    cdef double ratio = up / down
+    cdef double asset_price = spot * pow(down, steps)
+    cdef int i
+    for i in range(steps + 1):
+        payoffs[i] = _intrinsic(asset_price, strike, is_call)
+        asset_price *= ratio
+
+
+cdef double _crr_european(
+    double[::1] payoffs,
+    double spot,
+    double strike,
+    double up,
+    double down,
+    double discount,
+    double prob_up,
+    int steps,
+    bint is_call,
+) noexcept nogil:
+    cdef double prob_down = 1.0 - prob_up
+    cdef int step, i
+    _terminal_payoffs(payoffs, spot, strike, up, down, steps, is_call)
+    for step in range(steps - 1, -1, -1):
+        for i in range(step + 1):
+            payoffs[i] = discount * (prob_up * payoffs[i + 1] + prob_down * payoffs[i])
+    return payoffs[0]
+
+
+cdef double _crr_american(
+    double[::1] payoffs,
+    double spot,
+    double strike,
+    double up,
+    double down,
+    double discount,
+    double prob_up,
+    int steps,
+    bint is_call,
+) noexcept nogil:
+    cdef double prob_down = 1.0 - prob_up
+    cdef double ratio = up / down
+    cdef double lowest_price = spot * pow(down, steps)
+    cdef double asset_price, continuation
+    cdef int step, i
+    _terminal_payoffs(payoffs, spot, strike, up, down, steps, is_call)
+    for step in range(steps - 1, -1, -1):
+        lowest_price /= down
+        asset_price = lowest_price
+        for i in range(step + 1):
+            continuation = discount * (prob_up * payoffs[i + 1] + prob_down * payoffs[i])
+            payoffs[i] = fmax(continuation, _intrinsic(asset_price, strike, is_call))
+            asset_price *= ratio
+    return payoffs[0]
+
+
+def crr_price(
+    double[::1] payoffs,
+    double spot,
+    double strike,
+    double up,
+    double down,
+    double discount,
+    double prob_up,
+    int steps,
+    bint is_call,
+    bint is_american,
+) -> float:
+    """Price one option on a tree with ``steps`` levels, using ``payoffs`` as scratch space."""
+    if payoffs.shape[0] < steps + 1:
+        raise ValueError("payoffs buffer must hold at least steps + 1 values")
+
+    cdef double price
+    with nogil:
+        if is_american:
+            price = _crr_american(payoffs, spot, strike, up, down, discount, prob_up, steps, is_call)
+        else:
+            price = _crr_european(payoffs, spot, strike, up, down, discount, prob_up, steps, is_call)
+    return price
@@ -3,18 +3,56 @@
 The server exposes:
 - ``GET /``: Interactive form for entering simulation parameters.
 - ``POST /api/price``: JSON endpoint to compute a price via Monte Carlo simulation.
+- ``POST /api/price_async``: Start a simulation and return a job ID to poll.
+- ``GET /api/price_async/<job_id>``: Fetch the status or result of a job.
 
 It reuses :func:`price_monte_carlo_option` and :func:`build_expression_payoff`
 from :mod:`monte_carlo_option` so the pricing logic stays in one place.
+
+Simulations run on a shared process pool so request threads only handle
+JSON. Set ``OPTION_SERVER_SYNC=1`` to price on the request thread instead
+(handy for tests and debugging), and ``OPTION_SERVER_TIMEOUT`` to change how
+many seconds ``/api/price`` waits for a result (default 120). A timeout only
+stops the wait: a simulation that has already started keeps its worker until
+it finishes.
+
+At most ``OPTION_SERVER_MAX_JOBS`` async jobs (default 64) may be unfinished
+at once; further posts get HTTP 503. Finished jobs are forgotten once polled,
+or ``OPTION_SERVER_JOB_TTL`` seconds (default 600) after they finish.
+
+Requests whose ``steps * paths`` exceeds ``MC_MAX_CELLS`` (default 5e7) are
+rejected with HTTP 413 before any work is queued.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Mapping
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Mapping, get_args
+
+import orjson
+from flask import Flask, jsonify, render_template_string, request, url_for
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 
-from flask import Flask, jsonify, render_template_string, request
+from monte_carlo_option import (
+    NUMBA_AVAILABLE,
+    PricingMethod,
+    build_expression_payoff,
+    is_closed_form,
+    price_monte_carlo_option,
+)
 
-from monte_carlo_option import build_expression_payoff, price_monte_carlo_option
+
+MC_MAX_CELLS = int(float(os.environ.get("MC_MAX_CELLS", "5e7")))
+
+
+class RequestTooLargeError(ValueError):
+    """Raised when a request asks for more simulation work than the server allows."""
 
 
 @dataclass
@@ -29,6 +67,7 @@ class PricingRequest:
     dividend_yield: float
     payoff_expression: str
     seed: int | None
+    method: PricingMethod = "auto"
 
 
 def _parse_float(payload: Mapping[str, Any], key: str, *, default: float) -> float:
@@ -39,7 +78,7 @@ def _parse_float(payload: Mapping[str, Any], key: str, *, default: float) -> flo
         raise ValueError(f"{key} must be a number") from exc
 
 
-def _parse_int(payload: Mapping[str, Any], key: str, *, default: int, minimum: int = 1) -> int:
+def _parse_int(payload: Mapping[str, Any], key: str, *, default: int, minimum: int = 1, maximum: int | None = None) -> int:
     value = payload.get(key, default)
     try:
         parsed = int(value)
@@ -48,33 +87,68 @@ def _parse_int(payload: Mapping[str, Any], key: str, *, default: int, minimum: i
 
     if parsed < minimum:
         raise ValueError(f"{key} must be at least {minimum}")
+    if maximum is not None and parsed > maximum:
+        raise ValueError(f"{key} must be at most {maximum}")
     return parsed
 
 
-def _parse_optional_int(payload: Mapping[str, Any], key: str) -> int | None:
+def _parse_optional_int(payload: Mapping[str, Any], key: str, *, minimum: int, maximum: int) -> int | None:
     value = payload.get(key)
     if value in (None, "", "none", "null"):
         return None
     try:
-        return int(value)
+        parsed = int(value)
     except (TypeError, ValueError) as exc:
         raise ValueError(f"{key} must be an integer or omitted") from exc
 
+    if not minimum <= parsed <= maximum:
+        raise ValueError(f"{key} must be between {minimum} and {maximum}")
+    return parsed
+
+
+def _parse_choice(payload: Mapping[str, Any], key: str, *, choices: tuple[str, ...], default: str) -> str:
+    value = str(payload.get(key) or default)
+    if value not in choices:
+        raise ValueError(f"{key} must be one of {', '.join(choices)}")
+    return value
+
 
 def parse_pricing_request(payload: Mapping[str, Any]) -> PricingRequest:
-    return PricingRequest(
+    pricing_request = PricingRequest(
         spot=_parse_float(payload, "spot", default=100.0),
         strike=_parse_float(payload, "strike", default=100.0),
         rate=_parse_float(payload, "rate", default=0.05),
         volatility=_parse_float(payload, "volatility", default=0.2),
         maturity=_parse_float(payload, "maturity", default=1.0),
-        steps=_parse_int(payload, "steps", default=252, minimum=1),
-        paths=_parse_int(payload, "paths", default=50_000, minimum=1),
+        # Integer inputs are echoed back, and orjson only encodes 64-bit integers.
+        steps=_parse_int(payload, "steps", default=252, minimum=1, maximum=2**63 - 1),
+        paths=_parse_int(payload, "paths", default=50_000, minimum=1, maximum=2**63 - 1),
         dividend_yield=_parse_float(payload, "dividend_yield", default=0.0),
         payoff_expression=str(payload.get("payoff_expression", "max(s - strike, 0)")),
-        seed=_parse_optional_int(payload, "seed"),
+        seed=_parse_optional_int(payload, "seed", minimum=0, maximum=2**64 - 1),
+        method=_parse_choice(payload, "method", choices=get_args(PricingMethod), default="auto"),
     )
 
+    # Closed-form requests never simulate, so only bound the ones that might.
+    cells = pricing_request.steps * pricing_request.paths
+    if cells > MC_MAX_CELLS and not _is_closed_form(pricing_request):
+        raise RequestTooLargeError(f"steps * paths must be at most {MC_MAX_CELLS:,} (got {cells:,})")
+    return pricing_request
+
+
+def _is_closed_form(request_data: PricingRequest) -> bool:
+    """Whether :func:`price_monte_carlo_option` will answer without simulating.
+
+    Building the payoff only compiles and pattern-matches the expression; it
+    is not evaluated on the request thread.
+    """
+    try:
+        payoff = build_expression_payoff(request_data.payoff_expression, extra_context={"strike": request_data.strike})
+    except Exception:
+        # Let pricing report the broken expression.
+        return False
+    return is_closed_form(payoff, request_data.method)
+
 
 def price_option(request_data: PricingRequest) -> float:
     payoff = build_expression_payoff(request_data.payoff_expression, extra_context={"strike": request_data.strike})
@@ -89,10 +163,94 @@ def price_option(request_data: PricingRequest) -> float:
         dividend_yield=request_data.dividend_yield,
         payoff=payoff,
         seed=request_data.seed,
+        method=request_data.method,
     )
 
 
+def _init_worker() -> None:
+    """Keep each pool process to one Numba thread; the pool already fills every core."""
+    if NUMBA_AVAILABLE:
+        import numba
+
+        numba.set_num_threads(1)
+
+
+SYNC_PRICING = os.environ.get("OPTION_SERVER_SYNC", "").lower() in ("1", "true", "yes")
+PRICE_TIMEOUT = float(os.environ.get("OPTION_SERVER_TIMEOUT", "120"))
+MAX_PENDING_JOBS = int(os.environ.get("OPTION_SERVER_MAX_JOBS", "64"))
+JOB_TTL = float(os.environ.get("OPTION_SERVER_JOB_TTL", "600"))
+EXECUTOR = None if SYNC_PRICING else ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker)
+
+
+@dataclass
+class _Job:
+    request: PricingRequest
+    future: Future[float]
+    finished_at: float | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self.future.add_done_callback(self._mark_finished)
+
+    def _mark_finished(self, future: Future[float]) -> None:
+        self.finished_at = time.monotonic()
+
+
+_jobs: dict[str, _Job] = {}
+_jobs_lock = threading.Lock()
+
+
+def _expire_jobs() -> None:
+    """Drop jobs that finished more than :data:`JOB_TTL` seconds ago. Call with ``_jobs_lock`` held."""
+    cutoff = time.monotonic() - JOB_TTL
+    for job_id in [job_id for job_id, job in _jobs.items() if job.finished_at is not None and job.finished_at < cutoff]:
+        del _jobs[job_id]
+
+
+def submit_pricing(request_data: PricingRequest) -> Future[float]:
+    """Run :func:`price_option` on the worker pool (or inline in sync mode)."""
+    if EXECUTOR is not None:
+        return EXECUTOR.submit(price_option, request_data)
+
+    future: Future[float] = Future()
+    try:
+        future.set_result(price_option(request_data))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def _price_response(pricing_request: PricingRequest, price: float) -> dict[str, Any]:
+    return {
+        "price": price,
+        "inputs": {
+            "spot": pricing_request.spot,
+            "strike": pricing_request.strike,
+            "rate": pricing_request.rate,
+            "volatility": pricing_request.volatility,
+            "maturity": pricing_request.maturity,
+            "steps": pricing_request.steps,
+            "paths": pricing_request.paths,
+            "dividend_yield": pricing_request.dividend_yield,
+            "payoff_expression": pricing_request.payoff_expression,
+            "seed": pricing_request.seed,
+            "method": pricing_request.method,
+        },
+    }
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with :mod:`orjson`."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+Compress(app)
 
 
 @app.get("/")
@@ -110,7 +268,7 @@ def index() -> str:
                 body { font-family: system-ui, sans-serif; margin: 2rem auto; max-width: 900px; line-height: 1.5; padding: 0 1rem; }
                 form { display: grid; grid-template-columns: repeat(auto-fit, minmax(240px, 1fr)); gap: 1rem; margin-bottom: 1.5rem; }
                 label { display: flex; flex-direction: column; gap: 0.25rem; font-weight: 600; }
-                input, textarea { padding: 0.5rem; font-size: 1rem; }
+                input, select, textarea { padding: 0.5rem; font-size: 1rem; }
                 button { padding: 0.75rem 1.25rem; font-size: 1rem; cursor: pointer; }
                 pre { background: #f7f7f9; padding: 1rem; border-radius: 8px; overflow-x: auto; }
                 .full-width { grid-column: 1 / -1; }
@@ -131,6 +289,13 @@ def index() -> str:
                 <label>Paths<input name="paths" type="number" min="1" step="1" value="50000" required /></label>
                 <label>Dividend yield (q)<input name="dividend_yield" type="number" step="any" value="0" required /></label>
                 <label>Seed (optional)<input name="seed" type="number" step="1" /></label>
+                <label>Method
+                    <select name="method">
+                        <option value="auto" selected>auto (Black-Scholes for plain calls/puts)</option>
+                        <option value="mc">mc (always simulate)</option>
+                        <option value="analytic">analytic (Black-Scholes only)</option>
+                    </select>
+                </label>
                 <label class="full-width">Payoff expression<textarea name="payoff_expression" rows="3">max(s - strike, 0)</textarea></label>
                 <div class="full-width"><button type="submit">Price option</button></div>
             </form>
@@ -173,32 +338,68 @@ def api_price() -> tuple[Any, int]:
 
     try:
         pricing_request = parse_pricing_request(payload)
-        price = price_option(pricing_request)
+        future = submit_pricing(pricing_request)
+        price = future.result(timeout=PRICE_TIMEOUT)
+    except FutureTimeoutError:
+        # Only drops the job if it is still queued; a running simulation cannot be interrupted.
+        future.cancel()
+        return jsonify({"error": f"pricing did not finish within {PRICE_TIMEOUT:g} seconds; try /api/price_async"}), 504
+    except RequestTooLargeError as exc:
+        return jsonify({"error": str(exc)}), 413
     except ValueError as exc:
         return jsonify({"error": str(exc)}), 400
     except Exception as exc:  # pragma: no cover - defensive catch for unexpected errors
         return jsonify({"error": str(exc)}), 500
 
-    return (
-        jsonify(
-            {
-                "price": price,
-                "inputs": {
-                    "spot": pricing_request.spot,
-                    "strike": pricing_request.strike,
-                    "rate": pricing_request.rate,
-                    "volatility": pricing_request.volatility,
-                    "maturity": pricing_request.maturity,
-                    "steps": pricing_request.steps,
-                    "paths": pricing_request.paths,
-                    "dividend_yield": pricing_request.dividend_yield,
-                    "payoff_expression": pricing_request.payoff_expression,
-                    "seed": pricing_request.seed,
-                },
-            }
-        ),
-        200,
-    )
+    return jsonify(_price_response(pricing_request, price)), 200
+
+
+@app.post("/api/price_async")
+def api_price_async() -> tuple[Any, int]:
+    payload = request.get_json(silent=True) or {}
+
+    try:
+        pricing_request = parse_pricing_request(payload)
+    except RequestTooLargeError as exc:
+        return jsonify({"error": str(exc)}), 413
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    job_id = uuid.uuid4().hex
+    with _jobs_lock:
+        _expire_jobs()
+        pending = sum(not job.future.done() for job in _jobs.values())
+        if pending >= MAX_PENDING_JOBS:
+            return jsonify({"error": f"too many pending jobs ({pending}); try again later"}), 503
+        _jobs[job_id] = _Job(pricing_request, submit_pricing(pricing_request))
+
+    return jsonify({"job_id": job_id, "status_url": url_for("api_price_job", job_id=job_id)}), 202
+
+
+@app.get("/api/price_async/<job_id>")
+def api_price_job(job_id: str) -> tuple[Any, int]:
+    with _jobs_lock:
+        _expire_jobs()
+        job = _jobs.get(job_id)
+        if job is not None and job.future.done():
+            # Finished jobs are handed out once and then forgotten.
+            del _jobs[job_id]
+
+    if job is None:
+        return jsonify({"error": f"unknown job {job_id}"}), 404
+
+    pricing_request, future = job.request, job.future
+    if not future.done():
+        return jsonify({"job_id": job_id, "status": "running"}), 202
+
+    try:
+        price = future.result()
+    except ValueError as exc:
+        return jsonify({"job_id": job_id, "status": "failed", "error": str(exc)}), 400
+    except Exception as exc:  # pragma: no cover - defensive catch for unexpected errors
+        return jsonify({"job_id": job_id, "status": "failed", "error": str(exc)}), 500
+
+    return jsonify({"job_id": job_id, "status": "done", **_price_response(pricing_request, price)}), 200
 
 
 @app.get("/health")